@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import builtins
+import io
 import mimetypes
 import shutil
 import tempfile
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from collections.abc import Collection
 from collections.abc import Iterable
@@ -113,6 +115,7 @@ class Parser:
     :class:`~reader.Reader` only uses the following methods:
 
     * :meth:`parallel`
+    * :meth:`parallel_async`
     * :meth:`validate_url`
     * :meth:`process_feed_for_update`
     * :meth:`process_entry_pairs`
@@ -170,6 +173,7 @@ class Parser:
         self,
         feeds: Iterable[F],
         map: MapFunction[Any, Any] = map,
+        parse_map: MapFunction[Any, Any] | None = None,
     ) -> Iterable[ParseResult]:
         """Retrieve and parse many feeds, possibly in parallel.
 
@@ -180,6 +184,10 @@ class Parser:
             map (function):
                 A :func:`map`-like function;
                 the results can be in any order.
+            parse_map (function or None):
+                A :func:`map`-like function used to parse the retrieved feeds
+                (e.g. backed by a process pool); see :meth:`parse_offloaded`.
+                If not given, parse the feeds in the current thread.
 
         Yields:
             ParseResult:
@@ -189,39 +197,125 @@ class Parser:
         """
 
         with ExitStack() as stack:
-            # we may want to make this reentrant at some point
-            # (so retrievers don't need to deal with it)
-            for retriever in self.retrievers.values():
-                if isinstance(retriever, ContextManager):
-                    stack.enter_context(retriever)
+            self.enter_retrievers(stack)
 
             # if stuff hangs weirdly during debugging, change this to builtins.map
             retrieve_results = map(self.retrieve_fn, feeds)
 
-            # we could parallelize parse() as well;
-            # however, most of the time is spent in pure-Python code,
+            # we don't parallelize parse() using the same map,
+            # since most of the time is spent in pure-Python code,
             # which doesn't benefit from the threads on CPython:
             # https://github.com/lemon24/reader/issues/261#issuecomment-956412131
-            parse_results = builtins.map(self.parse_fn, retrieve_results)
+            parse_results: Iterable[ParseResultBase[F, Any, Any, Exception]]
+            if parse_map is None:
+                parse_results = builtins.map(self.parse_fn, retrieve_results)
+            else:
+                parse_results = self.parse_offloaded(retrieve_results, parse_map)
 
-            # interestingly, if we "yield from ..." instead of
-            # "for x in ...: yield x", mypy 1.11 does not complain
-            # about yielding ParseResult[Exception]
             for result in parse_results:
-                if isinstance(result.value, Exception):
-                    if not isinstance(result.value, ParseError):
-                        raise result.value
+                yield self.check_parse_result(result)
+
+    async def parallel_async(
+        self, feeds: Iterable[F], workers: int = 1
+    ) -> AsyncIterator[ParseResult]:
+        """Like :meth:`parallel`, but for use from asyncio code.
+
+        Feeds are retrieved and parsed in a pool of ``workers`` threads,
+        so the event loop is not blocked while waiting for them;
+        ``feeds`` is consumed in the event loop thread.
+
+        Args:
+            feeds (iterable(FeedArgument)): An iterable of feeds.
+            workers (int): Number of threads to use.
+
+        Yields:
+            ParseResult:
+                The result of retrieving and parsing a feed;
+                the :attr:`~ParseResult.feed` is the object passed in ``feeds``.
+
+        """
+        if workers < 1:
+            raise ValueError("workers must be a positive integer")
+
+        # lazy import (https://github.com/lemon24/reader/issues/297)
+        import asyncio
+        import concurrent.futures
 
-                    # don't expose parser-internal RetrieveError to callers
-                    # TODO: not needed once RetrieveError is public API
-                    if isinstance(result.value, RetrieveError):
-                        e = result.value
-                        value = ParseError(e.url, message=e.message)
-                        value.__traceback__ = e.__traceback__
-                        value.__cause__ = e.__cause__
-                        result = result._replace(value=value)
+        loop = asyncio.get_running_loop()
+
+        def retrieve_and_parse(
+            feed: F,
+        ) -> ParseResultBase[F, FeedData, EntryData, Exception]:
+            return self.parse_fn(self.retrieve_fn(feed))
+
+        with ExitStack() as stack:
+            self.enter_retrievers(stack)
+            executor = stack.enter_context(
+                concurrent.futures.ThreadPoolExecutor(workers)
+            )
+
+            # same as _utils.make_pool_map(), but awaiting the futures
+            feeds = iter(feeds)
+            feeds_ended = False
+            pending: set[
+                asyncio.Future[ParseResultBase[F, FeedData, EntryData, Exception]]
+            ] = set()
+
+            while pending or not feeds_ended:
+                while len(pending) < workers and not feeds_ended:
+                    try:
+                        feed = next(feeds)
+                    except StopIteration:
+                        feeds_ended = True
+                    else:
+                        pending.add(
+                            loop.run_in_executor(executor, retrieve_and_parse, feed)
+                        )
+
+                if not pending:  # pragma: no cover
+                    return
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield self.check_parse_result(future.result())
+
+    def enter_retrievers(self, stack: ExitStack) -> None:
+        """Enter the retrievers that are context managers.
+
+        Used by :meth:`parallel` and :meth:`parallel_async`.
+
+        """
+        # we may want to make this reentrant at some point
+        # (so retrievers don't need to deal with it)
+        for retriever in self.retrievers.values():
+            if isinstance(retriever, ContextManager):
+                stack.enter_context(retriever)
 
-                yield cast(ParseResult, result)
+    @staticmethod
+    def check_parse_result(
+        result: ParseResultBase[F, Any, Any, Exception],
+    ) -> ParseResult:
+        """Re-raise unexpected errors and hide parser-internal exceptions.
+
+        Used by :meth:`parallel` and :meth:`parallel_async`.
+
+        """
+        if isinstance(result.value, Exception):
+            if not isinstance(result.value, ParseError):
+                raise result.value
+
+            # don't expose parser-internal RetrieveError to callers
+            # TODO: not needed once RetrieveError is public API
+            if isinstance(result.value, RetrieveError):
+                e = result.value
+                value = ParseError(e.url, message=e.message)
+                value.__traceback__ = e.__traceback__
+                value.__cause__ = e.__cause__
+                result = result._replace(value=value)
+
+        return cast(ParseResult, result)
 
     def __call__(
         self, url: str, caching_info: JSONType | None = None
@@ -368,6 +462,66 @@ class Parser:
 
         return ParseResultBase(feed, value, http_info)
 
+    def parse_offloaded(
+        self,
+        results: Iterable[RetrieveResult[F, Any, Exception]],
+        map: MapFunction[Any, Any],
+    ) -> Iterable[ParseResultBase[F, FeedData, EntryData, Exception]]:
+        """Like :meth:`parse_fn`, but call the parsers through ``map``.
+
+        Used by :meth:`parallel` to parse feeds in other processes.
+
+        The parser is selected and the retrieved resource is read
+        in the current thread; the parser and the resource contents
+        are then sent to ``map``, so the parser must be picklable.
+        Mutations of the retrieved feed made by the parser are lost.
+
+        """
+        pending: dict[int, tuple[F, RetrievedFeed[None] | None, Any]] = {}
+
+        def make_jobs() -> Iterable[tuple[int, _ParseJob | None]]:
+            for key, result in enumerate(results):
+                feed, context = result
+
+                if isinstance(context, Exception):
+                    pending[key] = (feed, None, self.parse_fn(result))
+                    yield key, None
+                    continue
+
+                http_info = None
+                try:
+                    with context as retrieved:
+                        try:
+                            parser, mime_type = self.get_parser(
+                                feed.url, retrieved.mime_type
+                            )
+                            resource = retrieved.resource
+                            if hasattr(resource, 'read'):
+                                with wrap_exceptions(feed.url, "while reading feed"):
+                                    resource = io.BytesIO(resource.read())
+                        finally:
+                            http_info = retrieved.http_info
+                except Exception as e:
+                    pending[key] = (feed, None, ParseResultBase(feed, e, http_info))
+                    yield key, None
+                    continue
+
+                retrieved = retrieved._replace(resource=None, mime_type=mime_type)
+                pending[key] = (feed, retrieved, None)
+                headers = http_info.headers if http_info else None
+                yield key, _ParseJob(parser, feed.url, resource, headers)
+
+        for key, value in map(_run_parse_job, make_jobs()):
+            feed, retrieved, done = pending.pop(key)
+            if retrieved is None:
+                yield done
+                continue
+            if not isinstance(value, Exception):
+                value = ParsedFeed(
+                    *value, retrieved.mime_type, retrieved.caching_info
+                )
+            yield ParseResultBase(feed, value, retrieved.http_info)
+
     def parse(self, url: str, retrieved: RetrievedFeed[Any]) -> ParsedFeed:
         """Parse a retrieved feed.
 
@@ -619,6 +773,33 @@ class Parser:
             return list(parser.process_entry_pairs(url, pairs))
 
 
+class _ParseJob(NamedTuple):
+    parser: ParserType[Any]
+    url: str
+    resource: Any
+    headers: Headers | None
+
+
+def _run_parse_job(
+    job: tuple[int, _ParseJob | None],
+) -> tuple[int, FeedAndEntries | Exception | None]:
+    """:meth:`Parser.parse_offloaded` worker function.
+
+    Must be module-level, so it can be pickled.
+
+    """
+    key, args = job
+    if args is None:
+        return key, None
+    parser, url, resource, headers = args
+    try:
+        with wrap_exceptions(url, 'during parser'), bound_contextvars(feed=url):
+            feed, entries = parser(url, resource, headers)
+            return key, (feed, list(entries))
+    except Exception as e:
+        return key, e
+
+
 class FeedArgument(Protocol):  # pragma: no cover
     """Any :class:`~reader._types.FeedForUpdate`-like object."""
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import random
+from collections.abc import AsyncIterator
 from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime
@@ -342,19 +343,47 @@ class Pipeline(PipelineBase[FeedData, EntryData, FeedUpdateIntent, EntryUpdateIn
         | xargs -n1 parser.process_feed_for_update
         | xargs -n1 decider.process_feed_for_update
         | xargs -n1 -P $workers parser.retrieve
-        | xargs -n1 parser.parse
+        | xargs -n1 -P $parse_workers parser.parse
         | xargs -n1 storage.get_entries_for_update
         | xargs -n1 parser.process_entry_pairs
         | xargs -n1 decider.make_intents
         | xargs -n1 update_feed
 
-    At the moment, only parser.retrieve runs in parallel.
+    At the moment, only parser.retrieve runs in parallel (in threads);
+    if parse_workers > 1, parser.parse runs in parallel as well (in processes).
 
     """
 
     decider = Decider
 
     def parse_feeds(self, feeds: Iterable[FeedForUpdate]) -> Iterable[ParseResult]:
+        parse_errors: list[ParseResult] = []
+
+        with (
+            make_pool_map(self.workers) as parallel_map,
+            make_pool_map(self.parse_workers, processes=True) as parse_map,
+        ):
+            feeds = self.process_feeds_for_update(feeds, parse_errors)
+            parse_results = self.reader._parser.parallel(
+                feeds, parallel_map, parse_map if self.parse_workers > 1 else None
+            )
+            yield from chain(parse_results, parse_errors)
+
+    async def parse_feeds_async(
+        self, feeds: Iterable[FeedForUpdate]
+    ) -> AsyncIterator[ParseResult]:
+        parse_errors: list[ParseResult] = []
+
+        feeds = self.process_feeds_for_update(feeds, parse_errors)
+        parse_results = self.reader._parser.parallel_async(feeds, self.workers)
+        async for result in parse_results:
+            yield result
+        for result in parse_errors:
+            yield result
+
+    def process_feeds_for_update(
+        self, feeds: Iterable[FeedForUpdate], parse_errors: list[ParseResult]
+    ) -> Iterable[FeedForUpdate]:
         # ಠ_ಠ
         # The pipeline is not equipped to handle ParseErrors
         # as early as parser.process_feed_for_update().
@@ -363,22 +392,13 @@ class Pipeline(PipelineBase[FeedData, EntryData, FeedUpdateIntent, EntryUpdateIn
         # Storing the exceptions until the end of the generator
         # might cause memory issues, but the caller may need to raise them.
         # TODO: Rework update pipeline to support process_feed_for_update() exceptions.
-        parse_errors: list[ParseResult] = []
-
-        def parser_process_feeds_for_update(
-            feeds: Iterable[FeedForUpdate],
-        ) -> Iterable[FeedForUpdate]:
-            for feed in feeds:
-                try:
-                    yield self.reader._parser.process_feed_for_update(feed)
-                except ParseError as e:
-                    parse_errors.append(ParseResult(feed, e))
-
-        with make_pool_map(self.workers) as parallel_map:
-            feeds = parser_process_feeds_for_update(feeds)
-            feeds = map(self.decider.process_feed_for_update, feeds)
-            parse_results = self.reader._parser.parallel(feeds, parallel_map)
-            yield from chain(parse_results, parse_errors)
+        for feed in feeds:
+            try:
+                feed = self.reader._parser.process_feed_for_update(feed)
+            except ParseError as e:
+                parse_errors.append(ParseResult(feed, e))
+            else:
+                yield self.decider.process_feed_for_update(feed)
 
     def make_intents(
         self, result: ParseResult, entries: Iterable[EntryPair]
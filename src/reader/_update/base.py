@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from abc import abstractmethod
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Iterator
@@ -37,7 +38,7 @@ logger = get_logger('reader.update')
 
 
 PipelineFactory = Callable[
-    ['Reader', datetime, int, bool], 'PipelineBase[Any, Any, Any, Any]'
+    ['Reader', datetime, int, bool, int], 'PipelineBase[Any, Any, Any, Any]'
 ]
 
 
@@ -63,6 +64,7 @@ class PipelineBase(Generic[FD, ED, FI, EI], ABC):
     now: datetime
     workers: int
     call_feeds_hooks: bool
+    parse_workers: int = 1
 
     @abstractmethod
     def parse_feeds(
@@ -94,6 +96,17 @@ class PipelineBase(Generic[FD, ED, FI, EI], ABC):
     def get_entry_data(self, intent: EI) -> EntryData:
         """Transform an entry update intent into entry data (for plugins)."""
 
+    def parse_feeds_async(
+        self, feeds: Iterable[FeedForUpdate]
+    ) -> AsyncIterator[ParseResult[FD, ED]]:
+        """Retrieve and parse an iterable of feeds,
+        without blocking the event loop.
+
+        Optional; only needed by :meth:`update_async`.
+
+        """
+        raise NotImplementedError
+
     def update(self, filter: FeedFilter) -> Iterable[UpdateResult]:
 
         if self.call_feeds_hooks:
@@ -104,41 +117,68 @@ class PipelineBase(Generic[FD, ED, FI, EI], ABC):
         update_results = map(self.process_result, parse_results)
 
         for url, value in update_results:
-            log = logger.bind(feed=url)
+            if rv := self.make_update_result(url, value):
+                yield rv
 
-            if isinstance(value, FeedNotFoundError):
-                log.info(
-                    "updated", status='skipped', reason="feed removed during update"
-                )
-                continue
-
-            if isinstance(value, Exception):
-                if not isinstance(value, UpdateError):
-                    log.critical(
-                        "updated",
-                        status='critical',
-                        reason="unexpected error",
-                        exc_info=value,
-                    )
-                    raise value
-                log.error("updated", status='error', exc_info=value)
-            elif value is None:
-                log.info("updated", status='not_modified')
-            else:
-                log.info(
-                    "updated",
-                    status='ok',
-                    new=value.new,
-                    modified=value.modified,
-                    unmodified=value.unmodified,
-                )
+        if self.call_feeds_hooks:
+            with HookErrorGrouper("got unexpected after-update hook errors") as grouper:
+                grouper.run(self.reader._after_feeds_update, None, self.reader)
+
+    async def update_async(self, filter: FeedFilter) -> AsyncIterator[UpdateResult]:
+        """Like :meth:`update`, but for use from asyncio code.
 
-            yield UpdateResult(url, value)
+        Retrieving and parsing happen in :meth:`parse_feeds_async`.
+        Storage calls and hooks still run in the event loop thread,
+        since storage connections are thread-bound
+        (and private databases can only be used from the creating thread).
+
+        """
+        if self.call_feeds_hooks:
+            self.reader._before_feeds_update.run(None, self.reader)
+
+        feeds = self.reader._storage.get_feeds_for_update(filter)
+
+        async for result in self.parse_feeds_async(feeds):
+            url, value = self.process_result(result)
+            if rv := self.make_update_result(url, value):
+                yield rv
 
         if self.call_feeds_hooks:
             with HookErrorGrouper("got unexpected after-update hook errors") as grouper:
                 grouper.run(self.reader._after_feeds_update, None, self.reader)
 
+    def make_update_result(
+        self, url: str, value: UpdatedFeed | None | Exception
+    ) -> UpdateResult | None:
+        log = logger.bind(feed=url)
+
+        if isinstance(value, FeedNotFoundError):
+            log.info("updated", status='skipped', reason="feed removed during update")
+            return None
+
+        if isinstance(value, Exception):
+            if not isinstance(value, UpdateError):
+                log.critical(
+                    "updated",
+                    status='critical',
+                    reason="unexpected error",
+                    exc_info=value,
+                )
+                raise value
+            log.error("updated", status='error', exc_info=value)
+        elif value is None:
+            log.info("updated", status='not_modified')
+        else:
+            log.info(
+                "updated",
+                status='ok',
+                new=value.new,
+                modified=value.modified,
+                unmodified=value.unmodified,
+            )
+
+        return UpdateResult(url, value)
+
     def process_result(
         self, result: ParseResult[FD, ED]
     ) -> tuple[str, UpdatedFeed | None | Exception]:
@@ -91,17 +91,19 @@ MapFunction = Callable[[Callable[[_T], _U], Iterable[_T]], Iterator[_U]]
 
 def make_pool_map(
     workers: int,
+    processes: bool = False,
 ) -> CM[Callable[[Callable[[_T], _U], Iterable[_T]], Iterator[_U]]]:
     if workers < 1:
         raise ValueError("workers must be a positive integer")
     if workers == 1:
         return nullcontext(map)
-    return _make_pool_map(workers)
+    return _make_pool_map(workers, processes)
 
 
 @contextmanager
 def _make_pool_map(
     workers: int,
+    processes: bool = False,
 ) -> Iterator[Callable[[Callable[[_T], _U], Iterable[_T]], Iterator[_U]]]:
     # We are using concurrent.futures instead of multiprocessing.dummy
     # because the latter doesn't work on some environments (e.g. AWS Lambda).
@@ -110,7 +112,18 @@ def _make_pool_map(
     # lazy import (https://github.com/lemon24/reader/issues/297)
     import concurrent.futures
 
-    executor = concurrent.futures.ThreadPoolExecutor(workers)
+    executor: concurrent.futures.Executor
+    if not processes:
+        executor = concurrent.futures.ThreadPoolExecutor(workers)
+    else:
+        import multiprocessing
+
+        # By the time the process pool starts, other threads
+        # (e.g. the retriever thread pool) may already be running;
+        # fork() is not safe in that case, so always use spawn.
+        executor = concurrent.futures.ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context('spawn')
+        )
 
     def imap_unordered(fn: Callable[[_T], _U], iterable: Iterable[_T]) -> Iterator[_U]:
         iterable = iter(iterable)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import numbers
 import warnings
+from collections.abc import AsyncIterator
 from collections.abc import Callable
 from collections.abc import Iterable
 from collections.abc import Mapping
@@ -807,6 +808,7 @@ class Reader:
         new: bool | None = None,
         scheduled: bool = True,
         workers: int = 1,
+        parse_workers: int = 1,
     ) -> None:
         r"""Update all or some of the feeds.
 
@@ -838,6 +840,9 @@ class Reader:
                 Only update feeds scheduled to be updated.
                 Defaults to true.
             workers (int): Number of threads to use when getting the feeds.
+            parse_workers (int):
+                Number of processes to use when parsing the feeds.
+                Defaults to 1 (parse the feeds in the current thread).
 
         Raises:
             UpdateHookError: For unexpected hook exceptions.
@@ -890,6 +895,9 @@ class Reader:
         .. versionchanged:: 3.21
             Only update scheduled feeds by default.
 
+        .. versionadded:: 3.27
+            The ``parse_workers`` keyword argument.
+
         """
         with HookErrorGrouper("some hooks failed") as grouper:
             results = self.update_feeds_iter(
@@ -900,6 +908,7 @@ class Reader:
                 new=new,
                 scheduled=scheduled,
                 workers=workers,
+                parse_workers=parse_workers,
             )
 
             for url, value in results:
@@ -922,6 +931,7 @@ class Reader:
         new: bool | None = None,
         scheduled: bool = True,
         workers: int = 1,
+        parse_workers: int = 1,
         _call_feeds_hooks: bool = True,
     ) -> Iterable[UpdateResult]:
         r"""Update all or some of the feeds.
@@ -952,6 +962,9 @@ class Reader:
                 Only update feeds scheduled to be updated.
                 Defaults to true.
             workers (int): Number of threads to use when getting the feeds.
+            parse_workers (int):
+                Number of processes to use when parsing the feeds.
+                Defaults to 1 (parse the feeds in the current thread).
 
         Yields:
             :class:`UpdateResult`:
@@ -1017,6 +1030,9 @@ class Reader:
         .. versionchanged:: 3.21
             Only update scheduled feeds by default.
 
+        .. versionadded:: 3.27
+            The ``parse_workers`` keyword argument.
+
         """
         now = self._now()
 
@@ -1027,9 +1043,78 @@ class Reader:
             now, feed, tags, broken, updates_enabled, new, scheduled
         )
 
-        pipeline = self._make_pipeline(self, now, workers, _call_feeds_hooks)
+        pipeline = self._make_pipeline(
+            self, now, workers, _call_feeds_hooks, parse_workers
+        )
         yield from pipeline.update(filter)
 
+    async def update_feeds_async(
+        self,
+        *,
+        feed: FeedInput | None = None,
+        tags: TagFilterInput = None,
+        broken: bool | None = None,
+        updates_enabled: bool | None = True,
+        new: bool | None = None,
+        scheduled: bool = True,
+        workers: int = 1,
+        _call_feeds_hooks: bool = True,
+    ) -> AsyncIterator[UpdateResult]:
+        r"""Update all or some of the feeds, without blocking the event loop.
+
+        Like :meth:`update_feeds_iter`, but an asynchronous iterator,
+        for use from :mod:`asyncio` code.
+
+        Feeds are retrieved and parsed in a pool of ``workers`` threads;
+        results are yielded as soon as they are ready.
+        Storage calls and update hooks run in the event loop thread.
+
+        Args:
+            feed (str or tuple(str) or Feed or None): Only update the feed with this URL.
+            tags (None or bool or list(str or bool or list(str or bool))):
+                Only update feeds matching these tags;
+                see :data:`~reader.types.TagFilterInput` for details.
+            broken (bool or None): Only update broken / healthy feeds.
+            updates_enabled (bool or None):
+                Only update feeds that have updates enabled / disabled.
+                Defaults to true.
+            new (bool or None):
+                Only update feeds that have never been updated
+                / have been updated before. Defaults to None.
+            scheduled (bool):
+                Only update feeds scheduled to be updated.
+                Defaults to true.
+            workers (int):
+                Number of threads to use when getting and parsing the feeds.
+
+        Yields:
+            :class:`UpdateResult`:
+                An (url, value) pair;
+                see :meth:`update_feeds_iter` for details.
+
+        Raises:
+            UpdateHookError: For unexpected hook exceptions raised in
+                :attr:`before_feeds_update_hooks` or
+                :attr:`after_feeds_update_hooks`.
+            UpdateError: For non-feed-related update exceptions.
+            StorageError
+
+        .. versionadded:: 3.27
+
+        """
+        now = self._now()
+
+        if self._scheduled_override is not None:  # pragma: no cover
+            scheduled = self._scheduled_override
+
+        filter = FeedFilter.from_args(
+            now, feed, tags, broken, updates_enabled, new, scheduled
+        )
+
+        pipeline = self._make_pipeline(self, now, workers, _call_feeds_hooks, 1)
+        async for result in pipeline.update_async(filter):
+            yield result
+
     def update_feed(self, feed: FeedInput, /) -> UpdatedFeed | None:
         r"""Update a single feed.
 
@@ -89,6 +89,9 @@ class Parser:
         raise NotImplementedError
 
     parallel = reader._parser.Parser.parallel
+    parallel_async = reader._parser.Parser.parallel_async
+    enter_retrievers = reader._parser.Parser.enter_retrievers
+    check_parse_result = staticmethod(reader._parser.Parser.check_parse_result)
     retrieve_fn = reader._parser.Parser.retrieve_fn
     parse_fn = reader._parser.Parser.parse_fn
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from reader import EntryCounts
 from reader import EntrySearchCounts
 from reader import UpdateError
@@ -144,6 +146,19 @@ class _update_feeds_iter_methods:
     def update_feeds_iter_workers(reader, **kwargs):
         return reader.update_feeds_iter(workers=2, **kwargs)
 
+    def update_feeds_async(reader, **kwargs):
+        loop = asyncio.new_event_loop()
+        results = reader.update_feeds_async(**kwargs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(anext(results))
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+
     def update_feeds_iter_simulated(reader, **kwargs):
         kwargs.setdefault('scheduled', True)
         if reader._scheduled_override is not None:
@@ -1155,6 +1155,29 @@ def test_retrivers_run_in_parallel():
     assert not barrier.broken
 
 
+@pytest.mark.slow
+def test_parse_offloaded(data_dir):
+    parser = default_parser('')
+
+    names = ['full.rss', 'full.atom', 'full.json', 'empty.json', 'missing.rss']
+    feeds = [FeedForUpdate(str(data_dir.joinpath(name))) for name in names]
+
+    def parse_all(**kwargs):
+        rv = {}
+        for result in parser.parallel(feeds, **kwargs):
+            if isinstance(result.value, Exception):
+                result = result._replace(value=str(result.value))
+            rv[result.feed.url] = result
+        return rv
+
+    expected = parse_all()
+    with make_pool_map(2, processes=True) as parse_map:
+        actual = parse_all(parse_map=parse_map)
+
+    assert actual == expected
+    assert 'FileNotFoundError' in actual[feeds[-1].url].value
+
+
 def test_feedparser_parse_authors_rss():
     """Test the custom RSS author string splitting logic against known edge cases."""
 
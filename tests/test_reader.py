@@ -54,12 +54,13 @@ from utils import utc_datetime
 from utils import utc_datetime as datetime
 
 
+@pytest.mark.parametrize('kwarg', ['workers', 'parse_workers'])
 @pytest.mark.parametrize('workers', [-1, 0])
-def test_update_workers(reader, parser, workers):
+def test_update_workers(reader, parser, kwarg, workers):
     one = parser.feed(1, datetime(2010, 1, 1))
     reader.add_feed(one.url)
     with pytest.raises(ValueError):
-        reader.update_feeds(workers=workers)
+        reader.update_feeds(**{kwarg: workers})
 
 
 @pytest.fixture
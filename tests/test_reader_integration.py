@@ -68,7 +68,8 @@ def generate_response(body=b'', *, status='200 OK', **headers):
 
 
 @pytest.mark.parametrize('feed_type', ['rss', 'atom', 'json'])
-def test_local(reader, feed_type, data_dir, monkeypatch_datetime):
+@pytest.mark.parametrize('parse_workers', [1, pytest.param(2, marks=pytest.mark.slow)])
+def test_local(reader, feed_type, parse_workers, data_dir, monkeypatch_datetime):
     datetime = monkeypatch_datetime('reader.core.datetime')
 
     feed_filename = f'full.{feed_type}'
@@ -77,7 +78,7 @@ def test_local(reader, feed_type, data_dir, monkeypatch_datetime):
     datetime.now.set(datetime(2010, 1, 1))
     reader.add_feed(feed_url)
     datetime.now.set(datetime(2010, 1, 2))
-    reader.update_feeds()
+    reader.update_feeds(parse_workers=parse_workers)
 
     (feed,) = reader.get_feeds()
     entries = sorted(reader.get_entries(), key=lambda e: e.id)